@@ -1,20 +1,39 @@
 """GitHub integration for PR comments and annotations."""
 
+import functools
+import io
 import json
 import os
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
 
-from github import Github
-from github.PullRequest import PullRequest
+from .models import Summary, ValidationResult
 
-from .models import ValidationResult
+if TYPE_CHECKING:
+    import requests
 
+COMMENT_MARKER = "<!-- skill-doctor-results -->"
 
-def get_pr() -> PullRequest | None:  # pylint: disable=too-many-return-statements
+# Largest page size the GitHub REST API allows
+COMMENTS_PER_PAGE = 100
+
+REQUEST_TIMEOUT = 30
+
+
+@functools.lru_cache(maxsize=1)
+def _event_data(event_path: str) -> dict[str, Any]:
+    """Load the webhook event payload that triggered the workflow."""
+    with open(event_path, encoding="utf-8") as f:
+        data: dict[str, Any] = json.load(f)
+    return data
+
+
+def get_pr() -> tuple[str, int] | None:  # pylint: disable=too-many-return-statements
     """Get the current pull request from GitHub context.
 
     Returns:
-        PullRequest object or None if not in PR context
+        Tuple of (repository full name, PR number) or None if not in PR context
     """
     if os.environ.get("GITHUB_EVENT_NAME") != "pull_request":
         return None
@@ -34,135 +53,195 @@ def get_pr() -> PullRequest | None:  # pylint: disable=too-many-return-statement
         if not event_path:
             return None
 
-        with open(event_path, encoding="utf-8") as f:
-            event_data = json.load(f)
-
-        pr_number = event_data.get("pull_request", {}).get("number")
+        pr_number = _event_data(event_path).get("pull_request", {}).get("number")
         if not pr_number:
             return None
 
-        g = Github(token)
-        repo = g.get_repo(repo_name)
-        return repo.get_pull(pr_number)
+        return repo_name, pr_number
 
     except (OSError, json.JSONDecodeError, KeyError) as e:
         print(f"Warning: Failed to get PR context: {e}")
         return None
 
 
-def create_pr_comment(results: list[ValidationResult]) -> None:
+def _github_headers(token: str) -> dict[str, str]:
+    """Headers authenticating a request against the GitHub REST API."""
+    return {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+
+
+def _api_url() -> str:
+    """Base URL of the GitHub REST API (differs on GitHub Enterprise Server)."""
+    return os.environ.get("GITHUB_API_URL", "https://api.github.com").rstrip("/")
+
+
+def _find_bot_comment(
+    session: "requests.Session", repo_name: str, pr_number: int, marker: str
+) -> dict[str, Any] | None:
+    """Find the most recent PR comment containing marker.
+
+    The issue comments API only lists oldest-first, so when there is more
+    than one page this jumps to the last page and walks back, since the
+    comment is normally among the newest.
+
+    Args:
+        session: Authenticated GitHub session
+        repo_name: Repository full name (owner/repo)
+        pr_number: Pull request number
+        marker: Text identifying the comment
+
+    Returns:
+        Comment JSON object or None if no comment contains marker
+    """
+    first_page = session.get(
+        f"{_api_url()}/repos/{repo_name}/issues/{pr_number}/comments",
+        params={"per_page": COMMENTS_PER_PAGE},
+        timeout=REQUEST_TIMEOUT,
+    )
+    first_page.raise_for_status()
+
+    # Page links already carry the query parameters
+    response = first_page
+    last_url = first_page.links.get("last", {}).get("url")
+    if last_url:
+        response = session.get(last_url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+
+    while True:
+        comments = cast(list[dict[str, Any]], response.json())
+        for comment in comments[::-1]:
+            if marker in (comment.get("body") or ""):
+                return comment
+
+        prev_url = response.links.get("prev", {}).get("url")
+        if not prev_url:
+            return None
+        if prev_url == response.links.get("first", {}).get("url"):
+            # Already fetched by the first request
+            response = first_page
+            continue
+        response = session.get(prev_url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+
+
+def create_pr_comment(results: list[ValidationResult], summary: Summary) -> None:
     """Post validation results as a PR comment.
 
     Args:
         results: List of validation results
+        summary: Precomputed summary of results
     """
     pr = get_pr()
     if not pr:
         print("Skipping PR comment: not in PR context")
         return
+    repo_name, pr_number = pr
+
+    # Imported here so runs that never post a comment skip loading requests
+    import requests  # pylint: disable=import-outside-toplevel
 
     # Generate comment body
-    comment = generate_comment_body(results)
+    comment = generate_comment_body(results, summary)
+    full_comment = f"{COMMENT_MARKER}\n{comment}"
 
     try:
-        # Check if we already have a comment from this action
-        comments = pr.get_issue_comments()
-        bot_comment = None
-        marker = "<!-- skill-doctor-results -->"
-
-        for comment_obj in comments:
-            if marker in comment_obj.body:
-                bot_comment = comment_obj
-                break
-
-        full_comment = f"{marker}\n{comment}"
-
-        if bot_comment:
-            # Update existing comment
-            bot_comment.edit(full_comment)
-            print("Updated existing PR comment")
-        else:
-            # Create new comment
-            pr.create_issue_comment(full_comment)
-            print("Created new PR comment")
-
-    except OSError as e:
+        with requests.Session() as session:
+            session.headers.update(_github_headers(os.environ["INPUT_GITHUB-TOKEN"]))
+
+            # Check if we already have a comment from this action
+            bot_comment = _find_bot_comment(session, repo_name, pr_number, COMMENT_MARKER)
+
+            if bot_comment:
+                # Update existing comment
+                response = session.patch(
+                    bot_comment["url"], json={"body": full_comment}, timeout=REQUEST_TIMEOUT
+                )
+                response.raise_for_status()
+                print("Updated existing PR comment")
+            else:
+                # Create new comment
+                response = session.post(
+                    f"{_api_url()}/repos/{repo_name}/issues/{pr_number}/comments",
+                    json={"body": full_comment},
+                    timeout=REQUEST_TIMEOUT,
+                )
+                response.raise_for_status()
+                print("Created new PR comment")
+
+    except requests.RequestException as e:
         print(f"Warning: Failed to post PR comment: {e}")
 
 
-def generate_comment_body(results: list[ValidationResult]) -> str:
+def generate_comment_body(results: list[ValidationResult], summary: Summary) -> str:
     """Generate markdown comment body from validation results.
 
     Args:
         results: List of validation results
+        summary: Precomputed summary of results
 
     Returns:
         Formatted markdown string
     """
-    total_skills = len(results)
-    passed_skills = sum(1 for r in results if r.is_valid)
-    failed_skills = total_skills - passed_skills
-    total_errors = sum(len(r.errors or []) for r in results)
-
     # Header
-    if failed_skills == 0:
+    if summary.failed == 0:
         header = "## ✅ Agent Skills Validation Passed"
         emoji = "✅"
     else:
         header = "## ❌ Agent Skills Validation Failed"
         emoji = "❌"
 
-    lines = [header, ""]
+    buffer = io.StringIO()
+    write = buffer.write
+
+    write(f"{header}\n\n")
 
     # Summary
-    lines.append("### Summary")
-    lines.append(f"- Total skills validated: **{total_skills}**")
-    lines.append(f"- {emoji} Passed: **{passed_skills}**")
-    if failed_skills > 0:
-        lines.append(f"- ❌ Failed: **{failed_skills}**")
-        lines.append(f"- Total errors: **{total_errors}**")
-    lines.append("")
+    write("### Summary\n")
+    write(f"- Total skills validated: **{summary.total}**\n")
+    write(f"- {emoji} Passed: **{summary.passed}**\n")
+    if summary.failed > 0:
+        write(f"- ❌ Failed: **{summary.failed}**\n")
+        write(f"- Total errors: **{summary.total_errors}**\n")
+    write("\n")
 
     # Details for each skill
-    if failed_skills > 0:
-        lines.append("---")
-        lines.append("")
+    if summary.failed > 0:
+        write("---\n\n")
 
     for result in results:
         if not result.is_valid:
             skill_name = result.skill_name or Path(result.skill_path).name
-            lines.append(f"### ❌ `{skill_name}`")
-            lines.append(f"**Location:** `{result.skill_path}/SKILL.md`")
-            lines.append("")
+            write(f"### ❌ `{skill_name}`\n**Location:** `{result.skill_path}/SKILL.md`\n\n")
 
             if result.errors:
-                lines.append("**Errors:**")
+                write("**Errors:**\n")
                 for i, error in enumerate(result.errors, 1):
                     location = f"Line {error.line}" if error.line else "General"
-                    lines.append(f"{i}. **{location}:** {error.message}")
+                    write(f"{i}. **{location}:** {error.message}\n")
                     if error.suggestion:
-                        lines.append(f"   - 💡 **Suggestion:** {error.suggestion}")
-                lines.append("")
+                        write(f"   - 💡 **Suggestion:** {error.suggestion}\n")
+                write("\n")
 
     # Add passed skills summary
-    if passed_skills > 0:
-        lines.append("---")
-        lines.append("")
-        lines.append("### ✅ Passed Skills")
+    if summary.passed > 0:
+        write("---\n\n### ✅ Passed Skills\n")
         for result in results:
             if result.is_valid:
                 skill_name = result.skill_name or Path(result.skill_path).name
-                lines.append(f"- `{skill_name}`")
-        lines.append("")
+                write(f"- `{skill_name}`\n")
+        write("\n")
 
     # Footer
-    lines.append("---")
-    lines.append(
+    write("---\n")
+    write(
         "*For more information, see the "
         "[Agent Skills Specification](https://agentskills.io/specification)*"
     )
 
-    return "\n".join(lines)
+    return buffer.getvalue()
 
 
 def create_annotations(results: list[ValidationResult]) -> None:
@@ -174,13 +253,12 @@ def create_annotations(results: list[ValidationResult]) -> None:
     if not os.environ.get("GITHUB_ACTIONS"):
         return
 
+    annotations = []
     for result in results:
         if not result.is_valid and result.errors:
+            file_path = Path(result.skill_path) / "SKILL.md"
             for error in result.errors:
                 # Format: ::error file={name},line={line}::{message}
-                skill_path = Path(result.skill_path)
-                file_path = skill_path / "SKILL.md"
-
                 annotation = "::error"
                 annotation += f" file={file_path}"
                 if error.line:
@@ -190,4 +268,9 @@ def create_annotations(results: list[ValidationResult]) -> None:
                 if error.suggestion:
                     annotation += f" (Suggestion: {error.suggestion})"
 
-                print(annotation)
+                annotations.append(annotation)
+
+    # Write all annotations at once instead of one write per line
+    if annotations:
+        sys.stdout.write("\n".join(annotations) + "\n")
+        sys.stdout.flush()
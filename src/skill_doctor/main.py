@@ -5,13 +5,25 @@ import argparse
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from . import __version__
 from .github_integration import create_annotations, create_pr_comment
-from .models import ValidationResult
+from .models import Summary, ValidationResult
 from .skill_finder import find_skills
 from .validator import validate_skill
+from .validator_cache import ValidationCache
+
+# orjson (the 'json' extra) serializes results much faster than the stdlib
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+# Below this many skills the thread pool costs more than it saves
+PARALLEL_THRESHOLD = 4
 
 
 def parse_bool(value: str) -> bool:
@@ -41,22 +53,23 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--output-json", default="false", help="Output JSON results")
     parser.add_argument("--github-token", default="", help="GitHub token")
+    parser.add_argument(
+        "--cache-file", default="", help="Cache file for reusing results of unchanged skills"
+    )
 
     return parser.parse_args()
 
 
-def print_results(results: list[ValidationResult], show_suggestions: bool = True) -> None:
+def print_results(
+    results: list[ValidationResult], summary: Summary, show_suggestions: bool = True
+) -> None:
     """Print validation results to console.
 
     Args:
         results: List of validation results
+        summary: Precomputed summary of results
         show_suggestions: Whether to show fix suggestions
     """
-    total_skills = len(results)
-    passed_skills = sum(1 for r in results if r.is_valid)
-    failed_skills = total_skills - passed_skills
-    total_errors = sum(len(r.errors or []) for r in results)
-
     print()
     print("=" * 80)
     print("Skill Doctor - Validation Results")
@@ -64,11 +77,11 @@ def print_results(results: list[ValidationResult], show_suggestions: bool = True
     print()
 
     # Summary
-    print(f"Total skills validated: {total_skills}")
-    print(f"✅ Passed: {passed_skills}")
-    if failed_skills > 0:
-        print(f"❌ Failed: {failed_skills}")
-        print(f"Total errors: {total_errors}")
+    print(f"Total skills validated: {summary.total}")
+    print(f"✅ Passed: {summary.passed}")
+    if summary.failed > 0:
+        print(f"❌ Failed: {summary.failed}")
+        print(f"Total errors: {summary.total_errors}")
     print()
 
     # Details
@@ -95,6 +108,31 @@ def print_results(results: list[ValidationResult], show_suggestions: bool = True
     print()
 
 
+def validate_skills(
+    skill_dirs: list[Path], cache: ValidationCache | None = None
+) -> list[ValidationResult]:
+    """Validate skill directories, in parallel when there are enough of them.
+
+    Args:
+        skill_dirs: Resolved skill directories to validate, as returned by find_skills
+        cache: Optional cache to reuse results for unchanged skills
+
+    Returns:
+        Validation results in the same order as skill_dirs
+    """
+    for skill_dir in skill_dirs:
+        print(f"Validating: {skill_dir}")
+
+    # find_skills already resolved every directory
+    validate = partial(validate_skill, cache=cache, resolve=False)
+    if len(skill_dirs) < PARALLEL_THRESHOLD:
+        return [validate(skill_dir) for skill_dir in skill_dirs]
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(skill_dirs))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(validate, skill_dirs))
+
+
 def set_output(name: str, value: str) -> None:
     """Set a GitHub Actions output variable.
 
@@ -111,11 +149,14 @@ def set_output(name: str, value: str) -> None:
         print(f"::set-output name={name}::{value}")
 
 
-def save_json_results(results: list[ValidationResult], output_path: str = "results.json") -> str:
+def save_json_results(
+    results: list[ValidationResult], summary: Summary, output_path: str = "results.json"
+) -> str:
     """Save results as JSON.
 
     Args:
         results: List of validation results
+        summary: Precomputed summary of results
         output_path: Path to save JSON file
 
     Returns:
@@ -123,10 +164,10 @@ def save_json_results(results: list[ValidationResult], output_path: str = "resul
     """
     data = {
         "version": __version__,
-        "total_skills": len(results),
-        "passed": sum(1 for r in results if r.is_valid),
-        "failed": sum(1 for r in results if not r.is_valid),
-        "total_errors": sum(len(r.errors or []) for r in results),
+        "total_skills": summary.total,
+        "passed": summary.passed,
+        "failed": summary.failed,
+        "total_errors": summary.total_errors,
         "skills": [
             {
                 "path": r.skill_path,
@@ -139,15 +180,19 @@ def save_json_results(results: list[ValidationResult], output_path: str = "resul
                         "file": e.file,
                         "suggestion": e.suggestion,
                     }
-                    for e in (r.errors or [])
+                    for e in r.errors
                 ],
             }
             for r in results
         ],
     }
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
 
     return output_path
 
@@ -187,27 +232,30 @@ def main() -> int:
     print()
 
     # Validate each skill
-    results: list[ValidationResult] = []
-    for skill_dir in skill_dirs:
-        print(f"Validating: {skill_dir}")
-        result = validate_skill(skill_dir)
-        results.append(result)
+    cache = ValidationCache(args.cache_file) if args.cache_file else None
+    results = validate_skills(skill_dirs, cache)
+    if cache is not None:
+        try:
+            cache.save()
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: Failed to save validation cache: {e}")
+
+    summary = Summary.from_results(results)
 
     # Print results
-    print_results(results, show_suggestions)
+    print_results(results, summary, show_suggestions)
 
     # Set GitHub Actions outputs
-    total_errors = sum(len(r.errors or []) for r in results)
-    validation_status = "passed" if all(r.is_valid for r in results) else "failed"
+    validation_status = "passed" if summary.failed == 0 else "failed"
 
     set_output("validation-status", validation_status)
-    set_output("skills-validated", str(len(results)))
-    set_output("errors-found", str(total_errors))
+    set_output("skills-validated", str(summary.total))
+    set_output("errors-found", str(summary.total_errors))
 
     # Create PR comment
     if comment_on_pr and os.environ.get("GITHUB_EVENT_NAME") == "pull_request":
         print("Creating PR comment...")
-        create_pr_comment(results)
+        create_pr_comment(results, summary)
 
     # Create annotations
     if create_annot and os.environ.get("GITHUB_ACTIONS"):
@@ -216,7 +264,7 @@ def main() -> int:
 
     # Save JSON results
     if output_json:
-        json_path = save_json_results(results)
+        json_path = save_json_results(results, summary)
         set_output("json-results", json_path)
         print(f"JSON results saved to: {json_path}")
 
@@ -1,9 +1,10 @@
 """Data models for Agent Skills."""
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillProperties:
     """Properties of an Agent Skill from SKILL.md frontmatter."""
 
@@ -15,7 +16,7 @@ class SkillProperties:
     metadata: dict[str, str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     """A validation error found in a skill."""
 
@@ -24,6 +25,10 @@ class ValidationError:
     file: str = "SKILL.md"
     suggestion: str | None = None
 
+    def __post_init__(self) -> None:
+        """Share one copy of the file name across errors (e.g. when loaded from JSON)."""
+        self.file = sys.intern(self.file)
+
     def __str__(self) -> str:
         """Format error message."""
         location = f"{self.file}"
@@ -35,19 +40,14 @@ class ValidationError:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validating a skill."""
 
     skill_path: str
     skill_name: str | None = None
     is_valid: bool = True
-    errors: list[ValidationError] | None = None
-
-    def __post_init__(self) -> None:
-        """Initialize errors list if None."""
-        if self.errors is None:
-            self.errors = []
+    errors: list[ValidationError] = field(default_factory=list)
 
     def add_error(
         self,
@@ -57,7 +57,27 @@ class ValidationResult:
         suggestion: str | None = None,
     ) -> None:
         """Add a validation error."""
-        if self.errors is None:
-            self.errors = []
         self.errors.append(ValidationError(message, line, file, suggestion))
         self.is_valid = False
+
+
+@dataclass(slots=True)
+class Summary:
+    """Aggregate counts over a set of validation results."""
+
+    total: int = 0
+    passed: int = 0
+    failed: int = 0
+    total_errors: int = 0
+
+    @classmethod
+    def from_results(cls, results: list[ValidationResult]) -> "Summary":
+        """Compute the summary in a single pass over results."""
+        summary = cls(total=len(results))
+        for result in results:
+            if result.is_valid:
+                summary.passed += 1
+            else:
+                summary.failed += 1
+            summary.total_errors += len(result.errors)
+        return summary
@@ -6,6 +6,11 @@ import subprocess  # nosec B404 - subprocess is used safely with git commands
 from pathlib import Path
 
 
+def has_skill_md(directory: Path) -> bool:
+    """Check whether a directory contains SKILL.md (or skill.md)."""
+    return (directory / "SKILL.md").exists() or (directory / "skill.md").exists()
+
+
 def find_skills_by_pattern(pattern: str, base_path: Path = Path(".")) -> list[Path]:
     """Find skill directories matching a glob pattern.
 
@@ -14,7 +19,7 @@ def find_skills_by_pattern(pattern: str, base_path: Path = Path(".")) -> list[Pa
         base_path: Base path to search from (used for relative patterns)
 
     Returns:
-        List of paths to skill directories
+        List of resolved paths to skill directories
     """
     results = []
 
@@ -28,29 +33,78 @@ def find_skills_by_pattern(pattern: str, base_path: Path = Path(".")) -> list[Pa
             skill_dir = Path(path_str)
             if skill_dir.is_dir():
                 # Check if it contains SKILL.md
-                if (skill_dir / "SKILL.md").exists() or (skill_dir / "skill.md").exists():
-                    results.append(skill_dir)
+                if has_skill_md(skill_dir):
+                    results.append(skill_dir.resolve())
         return sorted(results)
 
     # Handle single directory (no glob pattern)
     pattern_path = Path(pattern)
     if pattern_path.is_absolute():
-        target_path = pattern_path
+        target_path = pattern_path.resolve()
     else:
         base_path = Path(base_path).resolve()
         target_path = base_path / pattern
 
     if target_path.is_dir():
         # Check if it contains SKILL.md
-        if (target_path / "SKILL.md").exists() or (target_path / "skill.md").exists():
+        if has_skill_md(target_path):
             results.append(target_path)
 
     return results
 
 
+def _changed_files_pygit2(base_ref: str) -> list[str] | None:
+    """List files changed between base_ref and HEAD using libgit2.
+
+    Args:
+        base_ref: Base branch reference
+
+    Returns:
+        Changed paths relative to the repository root, or None if pygit2 is
+        not installed or cannot compute the diff
+    """
+    try:
+        import pygit2  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+
+    try:
+        repo = pygit2.Repository(".")
+        base = repo.revparse_single(base_ref).peel(pygit2.Commit)
+        head = repo.revparse_single("HEAD").peel(pygit2.Commit)
+        diff = repo.diff(base, head)
+        # Detect renames like `git diff` does, so both backends list the same paths
+        diff.find_similar()
+    except (pygit2.GitError, KeyError, ValueError):
+        return None
+
+    return [delta.new_file.path for delta in diff.deltas]
+
+
+def _changed_files_git(base_ref: str) -> list[str]:
+    """List files changed between base_ref and HEAD using the git CLI.
+
+    Args:
+        base_ref: Base branch reference
+
+    Returns:
+        Changed paths relative to the repository root
+    """
+    # NUL-separated so git doesn't quote unusual paths
+    result = subprocess.run(  # nosec B603, B607 - git command is safe and controlled
+        ["git", "diff", "--name-only", "-z", base_ref, "HEAD"],
+        capture_output=True,
+        check=True,
+    )
+    return [os.fsdecode(name) for name in result.stdout.split(b"\0")]
+
+
 def find_changed_skills(base_ref: str = "origin/main") -> list[Path]:
     """Find skills that have changed in the current PR.
 
+    Uses pygit2 when it is installed (the ``git`` extra), avoiding a git
+    subprocess, and falls back to the git CLI otherwise.
+
     Args:
         base_ref: Base branch reference (default: origin/main)
 
@@ -59,16 +113,14 @@ def find_changed_skills(base_ref: str = "origin/main") -> list[Path]:
     """
     try:
         # Get changed files
-        result = subprocess.run(  # nosec B603, B607 - git command is safe and controlled
-            ["git", "diff", "--name-only", base_ref, "HEAD"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        changed_files = result.stdout.strip().split("\n")
+        changed_files = _changed_files_pygit2(base_ref)
+        if changed_files is None:
+            changed_files = _changed_files_git(base_ref)
 
         # Find unique skill directories
-        skill_dirs = set()
+        skill_dirs: set[Path] = set()
+        # Changed files share ancestors, so remember which directories are skills
+        is_skill_dir: dict[Path, bool] = {}
         for file_path in changed_files:
             if not file_path:
                 continue
@@ -79,15 +131,18 @@ def find_changed_skills(base_ref: str = "origin/main") -> list[Path]:
             if path.name.lower() == "skill.md":
                 skill_dir = path.parent
                 if skill_dir.is_dir():
-                    skill_dirs.add(skill_dir.resolve())
+                    skill_dirs.add(skill_dir)
             # Check if file is within a skill directory
             else:
                 for parent in path.parents:
-                    if (parent / "SKILL.md").exists() or (parent / "skill.md").exists():
-                        skill_dirs.add(parent.resolve())
+                    if parent not in is_skill_dir:
+                        is_skill_dir[parent] = has_skill_md(parent)
+                    if is_skill_dir[parent]:
+                        skill_dirs.add(parent)
                         break
 
-        return sorted(skill_dirs)
+        # Resolve once per skill rather than once per changed file
+        return sorted({skill_dir.resolve() for skill_dir in skill_dirs})
 
     except subprocess.CalledProcessError as e:
         print(f"Warning: Failed to detect changed files: {e}")
@@ -106,7 +161,7 @@ def find_skills(path: str = ".", mode: str = "single", base_ref: str = "origin/m
         base_ref: Base branch for changed mode
 
     Returns:
-        List of skill directories to validate
+        List of resolved skill directories to validate
     """
     if mode == "changed":
         # In PR context, find changed skills
@@ -3,24 +3,74 @@
 import re
 import unicodedata
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-import strictyaml
+import yaml
 
 from .models import ValidationResult
 
+if TYPE_CHECKING:
+    from .validator_cache import ValidationCache
+
+# Prefer the libyaml-backed loader; fall back to pure Python if it isn't built.
+# The base loader resolves no tags, so every scalar (keys included) stays a str.
+try:
+    from yaml import CBaseLoader as BaseLoader
+except ImportError:  # pragma: no cover
+    from yaml import BaseLoader  # type: ignore[assignment]
+
+_PLAIN_TAGS = frozenset({"tag:yaml.org,2002:str", "tag:yaml.org,2002:seq", "tag:yaml.org,2002:map"})
+
 # Constants from Agent Skills specification
 MAX_SKILL_NAME_LENGTH = 64
 MAX_DESCRIPTION_LENGTH = 1024
 MAX_COMPATIBILITY_LENGTH = 500
 
-ALLOWED_FIELDS = {
-    "name",
-    "description",
-    "license",
-    "allowed-tools",
-    "metadata",
-    "compatibility",
-}
+# Read size used when scanning SKILL.md for the end of its frontmatter
+FRONTMATTER_CHUNK_SIZE = 4096
+
+# Well-formed names: lowercase alphanumeric words joined by single hyphens
+_VALID_NAME_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+# Names made only of these characters need no per-character check
+_ASCII_NAME_RE = re.compile(r"[a-z0-9-]+")
+_HYPHEN_RUN_RE = re.compile(r"-+")
+
+ALLOWED_FIELDS: frozenset[str] = frozenset(
+    {
+        "name",
+        "description",
+        "license",
+        "allowed-tools",
+        "metadata",
+        "compatibility",
+    }
+)
+_ALLOWED_FIELDS_TEXT = ", ".join(sorted(ALLOWED_FIELDS))
+
+
+class _FrontmatterLoader(BaseLoader):  # pylint: disable=too-many-ancestors
+    """Base loader that rejects explicit tags and duplicate mapping keys."""
+
+    def construct_object(self, node: yaml.Node, deep: bool = False) -> Any:
+        if node.tag not in _PLAIN_TAGS:
+            raise yaml.constructor.ConstructorError(
+                None, None, f"explicit tag {node.tag!r} is not allowed", node.start_mark
+            )
+        return super().construct_object(node, deep=deep)
+
+    def construct_mapping(self, node: yaml.MappingNode, deep: bool = False) -> dict[Any, Any]:
+        seen = set()
+        for key_node, _ in node.value:
+            key = self.construct_object(key_node, deep=deep)
+            if key in seen:
+                raise yaml.constructor.ConstructorError(
+                    "while constructing a mapping",
+                    node.start_mark,
+                    f"found duplicate key {key!r}",
+                    key_node.start_mark,
+                )
+            seen.add(key)
+        return super().construct_mapping(node, deep=deep)
 
 
 def find_skill_md(skill_dir: Path) -> Path | None:
@@ -41,6 +91,38 @@ def find_skill_md(skill_dir: Path) -> Path | None:
     return None
 
 
+def read_frontmatter(path: Path) -> str:
+    """Read a SKILL.md file up to the end of its closing frontmatter fence.
+
+    Reading stops as soon as the closing fence is found, so the markdown body
+    is never loaded. A file that doesn't start with --- is only read far enough
+    to tell; one with unclosed frontmatter is read in full. parse_frontmatter
+    reports both problems from what was read.
+
+    Args:
+        path: Path to the SKILL.md file
+
+    Returns:
+        Decoded file content up to and including the closing ---
+    """
+    buffer = bytearray()
+    with open(path, "rb") as f:
+        while chunk := f.read(FRONTMATTER_CHUNK_SIZE):
+            # The fence may straddle the previous chunk boundary
+            start = max(3, len(buffer) - 3)
+            buffer += chunk
+            if not buffer.startswith(b"---"):
+                if len(buffer) < 3:
+                    continue
+                # Never valid; the read may end mid-character, so decode leniently
+                return buffer.decode("utf-8", errors="replace")
+            end = buffer.find(b"\n---", start)
+            if end != -1:
+                del buffer[end + 4 :]
+                break
+    return buffer.decode("utf-8")
+
+
 def parse_frontmatter(content: str) -> tuple[dict, str]:
     """Parse YAML frontmatter from SKILL.md content.
 
@@ -56,17 +138,17 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
     if not content.startswith("---"):
         raise ValueError("SKILL.md must start with YAML frontmatter (---)")
 
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+    # Closing fence must start a line; slice around it rather than splitting the file
+    end = content.find("\n---", 3)
+    if end == -1:
         raise ValueError("SKILL.md frontmatter not properly closed with ---")
 
-    frontmatter_str = parts[1]
-    body = parts[2].strip()
+    frontmatter_str = content[3:end]
+    body = content[end + 4 :].strip()
 
     try:
-        parsed = strictyaml.load(frontmatter_str)
-        metadata = parsed.data
-    except strictyaml.YAMLError as e:
+        metadata = yaml.load(frontmatter_str, Loader=_FrontmatterLoader)  # nosec B506 - base loader
+    except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in frontmatter: {e}") from e
 
     if not isinstance(metadata, dict):
@@ -79,26 +161,13 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
     return metadata, body
 
 
-def validate_name(name: str, skill_dir: Path | None, result: ValidationResult) -> None:
-    """Validate skill name format and directory match."""
-    if not name or not isinstance(name, str) or not name.strip():
-        result.add_error(
-            "Field 'name' must be a non-empty string",
-            line=2,
-            suggestion="Add a name field with a valid skill name",
-        )
-        return
-
-    name = unicodedata.normalize("NFKC", name.strip())
+def _nfkc(value: str) -> str:
+    """NFKC-normalize a string, skipping ASCII input which NFKC leaves unchanged."""
+    return value if value.isascii() else unicodedata.normalize("NFKC", value)
 
-    if len(name) > MAX_SKILL_NAME_LENGTH:
-        result.add_error(
-            f"Skill name '{name}' exceeds {MAX_SKILL_NAME_LENGTH} character limit "
-            f"({len(name)} chars)",
-            line=2,
-            suggestion=f"Shorten the name to {MAX_SKILL_NAME_LENGTH} characters or less",
-        )
 
+def _validate_name_format(name: str, result: ValidationResult) -> None:
+    """Report each way a skill name breaks the naming rules."""
     if name != name.lower():
         result.add_error(
             f"Skill name '{name}' must be lowercase",
@@ -117,21 +186,48 @@ def validate_name(name: str, skill_dir: Path | None, result: ValidationResult) -
         result.add_error(
             "Skill name cannot contain consecutive hyphens",
             line=2,
-            suggestion=f"Replace consecutive hyphens: '{re.sub(r'-+', '-', name)}'",
+            suggestion=f"Replace consecutive hyphens: '{_HYPHEN_RUN_RE.sub('-', name)}'",
         )
 
     # Check for invalid characters
-    if not all(c.isalnum() or c == "-" for c in name):
+    if not _ASCII_NAME_RE.fullmatch(name):
         invalid_chars = {c for c in name if not (c.isalnum() or c == "-")}
+        if invalid_chars:
+            result.add_error(
+                f"Skill name '{name}' contains invalid characters: "
+                f"{', '.join(sorted(invalid_chars))}",
+                line=2,
+                suggestion="Only letters, digits, and hyphens are allowed",
+            )
+
+
+def validate_name(name: str, skill_dir: Path | None, result: ValidationResult) -> None:
+    """Validate skill name format and directory match."""
+    if not name or not isinstance(name, str) or not name.strip():
         result.add_error(
-            f"Skill name '{name}' contains invalid characters: {', '.join(sorted(invalid_chars))}",
+            "Field 'name' must be a non-empty string",
             line=2,
-            suggestion="Only letters, digits, and hyphens are allowed",
+            suggestion="Add a name field with a valid skill name",
         )
+        return
+
+    name = _nfkc(name.strip())
+
+    if len(name) > MAX_SKILL_NAME_LENGTH:
+        result.add_error(
+            f"Skill name '{name}' exceeds {MAX_SKILL_NAME_LENGTH} character limit "
+            f"({len(name)} chars)",
+            line=2,
+            suggestion=f"Shorten the name to {MAX_SKILL_NAME_LENGTH} characters or less",
+        )
+
+    # Most names are well-formed; only run the individual checks when not
+    if not _VALID_NAME_RE.fullmatch(name):
+        _validate_name_format(name, result)
 
     # Check directory name matches
     if skill_dir:
-        dir_name = unicodedata.normalize("NFKC", skill_dir.name)
+        dir_name = _nfkc(skill_dir.name)
         if dir_name != name:
             result.add_error(
                 f"Directory name '{skill_dir.name}' must match skill name '{name}'",
@@ -178,56 +274,34 @@ def validate_compatibility(compatibility: str, result: ValidationResult) -> None
 
 def validate_metadata_fields(metadata: dict, result: ValidationResult) -> None:
     """Validate that only allowed fields are present."""
-    extra_fields = set(metadata.keys()) - ALLOWED_FIELDS
+    extra_fields = metadata.keys() - ALLOWED_FIELDS
     if extra_fields:
         result.add_error(
             f"Unexpected fields in frontmatter: {', '.join(sorted(extra_fields))}",
             line=1,
             suggestion=f"Remove unexpected fields or check spelling. "
-            f"Allowed fields: {', '.join(sorted(ALLOWED_FIELDS))}",
+            f"Allowed fields: {_ALLOWED_FIELDS_TEXT}",
         )
 
 
-def validate_skill(skill_dir: Path) -> ValidationResult:
-    """Validate a skill directory.
+def validate_skill_md(skill_md: Path, skill_dir: Path, result: ValidationResult) -> None:
+    """Validate the frontmatter of a skill's SKILL.md file.
 
     Args:
-        skill_dir: Path to the skill directory
-
-    Returns:
-        ValidationResult with any errors found
+        skill_md: Path to the SKILL.md file
+        skill_dir: Resolved path to the skill directory
+        result: Result to record errors on
     """
-    skill_dir = Path(skill_dir).resolve()
-    result = ValidationResult(skill_path=str(skill_dir))
-
-    # Check directory exists
-    if not skill_dir.exists():
-        result.add_error(f"Path does not exist: {skill_dir}")
-        return result
-
-    if not skill_dir.is_dir():
-        result.add_error(f"Not a directory: {skill_dir}")
-        return result
-
-    # Find SKILL.md
-    skill_md = find_skill_md(skill_dir)
-    if skill_md is None:
-        result.add_error(
-            "Missing required file: SKILL.md",
-            suggestion="Create a SKILL.md file with YAML frontmatter and instructions",
-        )
-        return result
-
     # Parse frontmatter
     try:
-        content = skill_md.read_text(encoding="utf-8")
+        content = read_frontmatter(skill_md)
         metadata, _ = parse_frontmatter(content)
     except (OSError, UnicodeDecodeError) as e:
         result.add_error(f"Error reading SKILL.md: {e}")
-        return result
+        return
     except ValueError as e:
         result.add_error(str(e))
-        return result
+        return
 
     # Validate metadata fields
     validate_metadata_fields(metadata, result)
@@ -240,7 +314,8 @@ def validate_skill(skill_dir: Path) -> ValidationResult:
             suggestion="Add 'name: your-skill-name' to the frontmatter",
         )
     else:
-        result.skill_name = metadata["name"]
+        if isinstance(metadata["name"], str):
+            result.skill_name = metadata["name"]
         validate_name(metadata["name"], skill_dir, result)
 
     if "description" not in metadata:
@@ -256,4 +331,64 @@ def validate_skill(skill_dir: Path) -> ValidationResult:
     if "compatibility" in metadata:
         validate_compatibility(metadata["compatibility"], result)
 
+
+def _validate_skill_md_cached(
+    skill_md: Path, skill_dir: Path, result: ValidationResult, cache: "ValidationCache"
+) -> ValidationResult:
+    """Validate SKILL.md, reusing the cached result if its contents are unchanged."""
+    try:
+        digest = cache.digest(skill_md)
+    except OSError as e:
+        result.add_error(f"Error reading SKILL.md: {e}")
+        return result
+
+    cached = cache.get(skill_md, digest)
+    if cached is not None:
+        return cached
+
+    validate_skill_md(skill_md, skill_dir, result)
+    cache.put(skill_md, digest, result)
+    return result
+
+
+def validate_skill(
+    skill_dir: Path, cache: "ValidationCache | None" = None, *, resolve: bool = True
+) -> ValidationResult:
+    """Validate a skill directory.
+
+    Args:
+        skill_dir: Path to the skill directory
+        cache: Optional cache to reuse results for unchanged SKILL.md files
+        resolve: Resolve skill_dir first; pass False if it is already resolved
+
+    Returns:
+        ValidationResult with any errors found
+    """
+    skill_dir = Path(skill_dir)
+    if resolve:
+        skill_dir = skill_dir.resolve()
+    result = ValidationResult(skill_path=str(skill_dir))
+
+    # Check directory exists
+    if not skill_dir.exists():
+        result.add_error(f"Path does not exist: {skill_dir}")
+        return result
+
+    if not skill_dir.is_dir():
+        result.add_error(f"Not a directory: {skill_dir}")
+        return result
+
+    # Find SKILL.md
+    skill_md = find_skill_md(skill_dir)
+    if skill_md is None:
+        result.add_error(
+            "Missing required file: SKILL.md",
+            suggestion="Create a SKILL.md file with YAML frontmatter and instructions",
+        )
+        return result
+
+    if cache is not None:
+        return _validate_skill_md_cached(skill_md, skill_dir, result, cache)
+
+    validate_skill_md(skill_md, skill_dir, result)
     return result
@@ -0,0 +1,108 @@
+"""On-disk cache of validation results for unchanged SKILL.md files."""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict
+from pathlib import Path
+
+from . import __version__
+from .models import ValidationError, ValidationResult
+
+
+class ValidationCache:
+    """Validation results keyed by SKILL.md path and content digest.
+
+    Keying on contents rather than modification time lets results carry over to
+    a fresh checkout, where every file is rewritten. Entries are discarded when
+    the file was written by a different Skill Doctor version, since validation
+    rules may have changed. Safe to share between threads.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Load the cache file at path, starting empty if it is missing or unreadable."""
+        self.path = Path(path)
+        self._entries: dict[str, dict] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict) and data.get("version") == __version__:
+            entries = data.get("entries")
+            if isinstance(entries, dict):
+                self._entries = entries
+
+    @staticmethod
+    def digest(skill_md: Path) -> str:
+        """Return the SHA-256 hex digest of skill_md's contents.
+
+        Raises:
+            OSError: If the file can't be read
+        """
+        with open(skill_md, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    def get(self, skill_md: Path, digest: str) -> ValidationResult | None:
+        """Return the cached result for skill_md if its contents are unchanged.
+
+        Args:
+            skill_md: Path to the SKILL.md file
+            digest: Current digest of skill_md
+
+        Returns:
+            Cached ValidationResult, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(str(skill_md))
+        if not isinstance(entry, dict) or entry.get("sha256") != digest:
+            return None
+
+        # A malformed entry is a miss; the skill is revalidated and the entry replaced
+        try:
+            data = entry["result"]
+            return ValidationResult(
+                skill_path=data["skill_path"],
+                skill_name=data["skill_name"],
+                is_valid=data["is_valid"],
+                errors=[ValidationError(**e) for e in data["errors"]],
+            )
+        except (KeyError, TypeError):
+            return None
+
+    def put(self, skill_md: Path, digest: str, result: ValidationResult) -> None:
+        """Store the result of validating skill_md.
+
+        Args:
+            skill_md: Path to the SKILL.md file
+            digest: Digest of skill_md taken before it was validated
+            result: Validation result to cache
+        """
+        with self._lock:
+            self._entries[str(skill_md)] = {"sha256": digest, "result": asdict(result)}
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if any entries were added.
+
+        Raises:
+            OSError: If the cache file can't be written
+            TypeError: If a cached result holds a value JSON can't represent
+            ValueError: If a cached result can't be encoded as JSON
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            # Serialize before touching disk so a bad entry can't leave a partial file
+            text = json.dumps({"version": __version__, "entries": self._entries})
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
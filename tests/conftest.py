@@ -0,0 +1,122 @@
+"""Shared fixtures for the test suite.
+
+Validation never modifies a skill directory, so each one is written once per
+session and shared by every test that needs it.
+"""
+
+import functools
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from skill_doctor.validator import validate_skill
+
+# Same contents as tests/fixtures/{valid,invalid}-skill, which CI runs the action against
+VALID_SKILL_MD = """---
+name: valid-skill
+description: A valid test skill with all required fields and proper formatting for testing the validator
+---
+
+# Valid Test Skill
+
+This is a valid skill for testing purposes.
+
+## Instructions
+
+This skill demonstrates proper formatting according to the Agent Skills specification.
+"""
+INVALID_SKILL_MD = """---
+name: Invalid-Skill
+description: This description is intentionally missing to test validation errors
+---
+
+# Invalid Test Skill
+
+This skill has validation errors for testing purposes.
+"""
+
+LONG_NAME = "x" * 65
+
+# SKILL.md bodies varying only the name or the description
+NAME_TEMPLATE = """---
+name: %s
+description: Test skill
+---
+Body content
+"""
+DESC_TEMPLATE = """---
+name: test-skill
+description: %s
+---
+Body content
+"""
+
+# Canonical SKILL.md contents, written once and linked into skill directories
+SKILL_TEMPLATES = {
+    "valid": VALID_SKILL_MD,
+    "invalid": INVALID_SKILL_MD,
+    "basic": NAME_TEMPLATE % "test-skill",
+    "missing_name": """---
+description: A skill without a name
+---
+Body content
+""",
+    "missing_description": """---
+name: test-skill
+---
+Body content
+""",
+    "long_name": NAME_TEMPLATE % LONG_NAME,
+    "uppercase": NAME_TEMPLATE % "Test-Skill",
+    "consecutive_hyphens": NAME_TEMPLATE % "test--skill",
+    "long_description": DESC_TEMPLATE % ("x" * 1025),
+    "invalid_chars": NAME_TEMPLATE % "test_skill",
+    "leading_hyphen": NAME_TEMPLATE % "-test-skill",
+}
+
+
+@pytest.fixture(scope="session")
+def validate_cache():
+    """validate_skill memoized by path; results are shared, so treat them as read-only."""
+    return functools.lru_cache(maxsize=None)(lambda path: validate_skill(Path(path)))
+
+
+@pytest.fixture(scope="session")
+def skill_templates(tmp_path_factory):
+    """Paths to the SKILL_TEMPLATES files, written once per session."""
+    canonical = tmp_path_factory.mktemp("canonical")
+    paths = {}
+    for template, content in SKILL_TEMPLATES.items():
+        paths[template] = canonical / f"{template}.md"
+        paths[template].write_text(content)
+    return paths
+
+
+@pytest.fixture(scope="session")
+def make_skill_dir(tmp_path_factory, skill_templates):
+    """Factory make_skill_dir(name, template) hard-linking a template as name/SKILL.md."""
+
+    def make(name, template):
+        skill_dir = tmp_path_factory.mktemp("skill") / name
+        skill_dir.mkdir()
+        try:
+            os.link(skill_templates[template], skill_dir / "SKILL.md")
+        except OSError:
+            shutil.copyfile(skill_templates[template], skill_dir / "SKILL.md")
+        return skill_dir
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def valid_skill_path(make_skill_dir):
+    """Path to valid test skill."""
+    return make_skill_dir("valid-skill", "valid")
+
+
+@pytest.fixture(scope="session")
+def invalid_skill_path(make_skill_dir):
+    """Path to invalid test skill."""
+    return make_skill_dir("invalid-skill", "invalid")
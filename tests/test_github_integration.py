@@ -0,0 +1,78 @@
+"""Tests for the github_integration module."""
+
+import pytest
+
+from skill_doctor.github_integration import _find_bot_comment
+
+MARKER = "<!-- marker -->"
+COMMENTS_URL = "https://api.github.com/repos/owner/repo/issues/1/comments"
+
+
+def _page_url(page):
+    return f"{COMMENTS_URL}?per_page=100&page={page}"
+
+
+@pytest.fixture
+def paged_session(mocker):
+    """Factory building a mock session that serves the given pages of comments."""
+
+    def make(pages):
+        last = len(pages)
+        responses = {}
+        for page, bodies in enumerate(pages, 1):
+            links = {}
+            if page > 1:
+                links["first"] = {"url": _page_url(1)}
+                links["prev"] = {"url": _page_url(page - 1)}
+            if page < last:
+                links["next"] = {"url": _page_url(page + 1)}
+                links["last"] = {"url": _page_url(last)}
+            response = mocker.Mock(links=links)
+            response.json.return_value = [
+                {"id": (page, i), "body": b} for i, b in enumerate(bodies)
+            ]
+            responses[_page_url(page)] = response
+
+        session = mocker.Mock()
+        session.get.side_effect = lambda url, params=None, timeout=None: (
+            responses[_page_url(1)] if params else responses[url]
+        )
+        return session
+
+    return make
+
+
+def _fetched(session):
+    """Page URLs requested after the initial request, in order."""
+    return [c.args[0] for c in session.get.call_args_list[1:]]
+
+
+def test_find_bot_comment_single_page(paged_session):
+    """Test finding the newest matching comment on the only page."""
+    session = paged_session([[f"{MARKER} old", "other", f"{MARKER} new"]])
+    comment = _find_bot_comment(session, "owner/repo", 1, MARKER)
+    assert comment["body"] == f"{MARKER} new"
+    assert session.get.call_count == 1
+
+
+def test_find_bot_comment_on_last_page(paged_session):
+    """Test that the last page is searched first and matches without walking back."""
+    session = paged_session([[f"{MARKER} old"], ["other"], [f"{MARKER} new", "other"]])
+    comment = _find_bot_comment(session, "owner/repo", 1, MARKER)
+    assert comment["body"] == f"{MARKER} new"
+    assert _fetched(session) == [_page_url(3)]
+
+
+def test_find_bot_comment_on_earlier_page(paged_session):
+    """Test walking back from the last page, reusing the first page response."""
+    session = paged_session([[f"{MARKER} old"], ["other"], ["other"]])
+    comment = _find_bot_comment(session, "owner/repo", 1, MARKER)
+    assert comment["id"] == (1, 0)
+    assert _fetched(session) == [_page_url(3), _page_url(2)]
+
+
+def test_find_bot_comment_no_match(paged_session):
+    """Test that every page is searched once when no comment matches."""
+    session = paged_session([["other"], ["other"], ["other"]])
+    assert _find_bot_comment(session, "owner/repo", 1, MARKER) is None
+    assert _fetched(session) == [_page_url(3), _page_url(2)]
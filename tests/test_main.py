@@ -0,0 +1,58 @@
+"""Tests for the main module."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from skill_doctor import main
+from skill_doctor.models import Summary, ValidationResult
+
+
+def test_save_json_results_same_with_and_without_orjson(tmp_path, monkeypatch):
+    """Test that orjson and the stdlib fallback write the same JSON document."""
+    pytest.importorskip("orjson")
+    invalid = ValidationResult(skill_path="/skills/Bad-Skill", skill_name="Bad-Skill")
+    invalid.add_error("Skill name 'Bad-Skill' must be lowercase", line=2, suggestion="bad-skill")
+    results = [ValidationResult(skill_path="/skills/ok", skill_name="ok"), invalid]
+    summary = Summary.from_results(results)
+
+    with_orjson = main.save_json_results(results, summary, str(tmp_path / "orjson.json"))
+    monkeypatch.setattr(main, "orjson", None)
+    with_stdlib = main.save_json_results(results, summary, str(tmp_path / "stdlib.json"))
+
+    with open(with_orjson, encoding="utf-8") as f:
+        data = json.load(f)
+    with open(with_stdlib, encoding="utf-8") as f:
+        assert json.load(f) == data
+    assert data["failed"] == 1
+    assert data["skills"][1]["errors"][0]["line"] == 2
+
+
+@pytest.fixture(scope="module")
+def mixed_skill_dirs(make_skill_dir):
+    """Valid, invalid, and nonexistent skill directories, enough to use the thread pool."""
+    dirs = []
+    for i in range(main.PARALLEL_THRESHOLD):
+        dirs.append(make_skill_dir("test-skill", "basic"))
+        dirs.append(make_skill_dir("Test-Skill", "uppercase"))
+        dirs.append(Path(f"/__skill_doctor_no_such_path_{i}__"))
+    return dirs
+
+
+def test_validate_skills_parallel_keeps_order(mixed_skill_dirs, mocker):
+    """Test that pooled validation returns results in input order."""
+    pool = mocker.patch.object(main, "ThreadPoolExecutor", wraps=main.ThreadPoolExecutor)
+    results = main.validate_skills(mixed_skill_dirs)
+    pool.assert_called_once()
+    assert [r.skill_path for r in results] == [str(d.resolve()) for d in mixed_skill_dirs]
+    assert [r.is_valid for r in results] == [True, False, False] * main.PARALLEL_THRESHOLD
+
+
+def test_validate_skills_sequential_matches_parallel(mixed_skill_dirs):
+    """Test that validating below the threshold gives the same results as the pool."""
+    sequential = mixed_skill_dirs[: main.PARALLEL_THRESHOLD - 1]
+    assert (
+        main.validate_skills(sequential)
+        == main.validate_skills(mixed_skill_dirs)[: len(sequential)]
+    )
@@ -0,0 +1,64 @@
+"""Tests for the skill_finder module."""
+
+import subprocess
+
+import pytest
+
+from skill_doctor import skill_finder
+from skill_doctor.skill_finder import find_changed_skills, find_skills
+
+SKILLS = ["a", "b", "c", "d", "ünï"]
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture(scope="module")
+def changed_repo(tmp_path_factory):
+    """Git repo whose HEAD renames, deletes, and edits files under skills/ relative to 'base'."""
+    repo = tmp_path_factory.mktemp("repo")
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test")
+    _git(repo, "config", "diff.renames", "true")
+    for name in SKILLS:
+        skill_dir = repo / "skills" / name
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\ndescription: Test skill\n---\n")
+    (repo / "skills" / "b" / "ref.txt").write_text("reference material\n" * 20)
+    (repo / "skills" / "c" / "old.txt").write_text("obsolete\n")
+    (repo / "skills" / "ünï" / "notes.txt").write_text("notes\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "base")
+    _git(repo, "branch", "base")
+
+    _git(repo, "mv", "skills/b/ref.txt", "skills/d/moved.txt")
+    _git(repo, "rm", "-q", "skills/c/old.txt")
+    (repo / "skills" / "ünï" / "notes.txt").write_text("more notes\n")
+    _git(repo, "commit", "-q", "-am", "change")
+    return repo
+
+
+@pytest.fixture(params=["pygit2", "git"])
+def backend(request, monkeypatch):
+    """Run find_changed_skills through each changed-files backend."""
+    if request.param == "pygit2":
+        pytest.importorskip("pygit2")
+    else:
+        monkeypatch.setattr(skill_finder, "_changed_files_pygit2", lambda base_ref: None)
+    return request.param
+
+
+def test_find_changed_skills(changed_repo, backend, monkeypatch):
+    """Test that both backends find the same skills for renames, deletes, and non-ASCII paths."""
+    monkeypatch.chdir(changed_repo)
+    skills = changed_repo.resolve() / "skills"
+    assert find_changed_skills("base") == [skills / "c", skills / "d", skills / "ünï"]
+
+
+def test_find_skills_multiple_resolves(changed_repo, monkeypatch):
+    """Test that a relative glob yields resolved paths, so validation needn't resolve again."""
+    monkeypatch.chdir(changed_repo)
+    skills = changed_repo.resolve() / "skills"
+    assert find_skills("skills/*", "multiple") == [skills / name for name in sorted(SKILLS)]
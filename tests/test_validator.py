@@ -4,19 +4,84 @@ from pathlib import Path
 
 import pytest
 
-from skill_doctor.validator import find_skill_md, parse_frontmatter, validate_skill
+from skill_doctor.validator import (
+    FRONTMATTER_CHUNK_SIZE,
+    find_skill_md,
+    parse_frontmatter,
+    read_frontmatter,
+    validate_skill,
+)
+
+VALID_FM = """---
+name: test-skill
+description: A test skill
+---
 
+# Body content
+"""
 
-@pytest.fixture
-def valid_skill_path():
-    """Path to valid test skill."""
-    return Path(__file__).parent / "fixtures" / "valid-skill"
+DASHES_IN_VALUE_FM = """---
+name: test-skill
+description: Before---after
+---
+Body
+"""
 
+NO_FM = "# No frontmatter here"
 
-@pytest.fixture
-def invalid_skill_path():
-    """Path to invalid test skill."""
-    return Path(__file__).parent / "fixtures" / "invalid-skill"
+UNCLOSED_FM = """---
+name: test-skill
+"""
+
+INVALID_YAML_FM = """---
+name: test-skill
+description: broken: [yaml
+---
+"""
+
+UNTYPED_SCALARS_FM = """---
+name: 2024-01-01
+description: yes
+1: z
+---
+"""
+
+DUPLICATE_KEY_FM = """---
+name: test-skill
+name: other-skill
+description: Test skill
+---
+"""
+
+TAGGED_VALUE_FM = """---
+name: !!python/object:os.system test-skill
+description: Test skill
+---
+"""
+
+LIST_NAME_FM = """---
+name: [a, b]
+description: Test skill
+---
+"""
+
+# (directory name, conftest SKILL_TEMPLATES key, expected error substring)
+INVALID_CASES = [
+    ("test-skill", "missing_name", "Missing required field in frontmatter: name"),
+    ("test-skill", "missing_description", "Missing required field in frontmatter: description"),
+    ("x" * 65, "long_name", "exceeds 64 character limit"),
+    ("Test-Skill", "uppercase", "must be lowercase"),
+    ("test--skill", "consecutive_hyphens", "consecutive hyphens"),
+    ("test-skill", "long_description", "Description exceeds"),
+    ("wrong-name", "basic", "must match skill name"),
+    ("test_skill", "invalid_chars", "invalid characters: _"),
+    ("-test-skill", "leading_hyphen", "cannot start or end with a hyphen"),
+]
+
+
+def _msgs(result):
+    """All error messages of a result joined into one string."""
+    return "\n".join(e.message for e in result.errors)
 
 
 def test_find_skill_md_uppercase(valid_skill_path):
@@ -24,197 +89,178 @@ def test_find_skill_md_uppercase(valid_skill_path):
     skill_md = find_skill_md(valid_skill_path)
     assert skill_md is not None
     assert skill_md.name == "SKILL.md"
-    assert skill_md.exists()
 
 
-def test_find_skill_md_missing(tmp_path):
+def test_find_skill_md_missing(fs):
     """Test finding SKILL.md when it doesn't exist."""
-    skill_md = find_skill_md(tmp_path)
+    skill_dir = Path("/skills/test-skill")
+    fs.create_dir(skill_dir)
+    skill_md = find_skill_md(skill_dir)
     assert skill_md is None
 
 
-def test_parse_frontmatter_valid():
-    """Test parsing valid frontmatter."""
-    content = """---
-name: test-skill
-description: A test skill
----
-
-# Body content
-"""
-    metadata, body = parse_frontmatter(content)
-    assert metadata["name"] == "test-skill"
-    assert metadata["description"] == "A test skill"
-    assert body.strip() == "# Body content"
+def test_read_frontmatter_stops_at_closing_fence(fs):
+    """Test that only the frontmatter is read from SKILL.md."""
+    skill_md = Path("/skills/test-skill/SKILL.md")
+    fs.create_file(
+        skill_md, contents="---\nname: test-skill\n---\n" + "x" * (FRONTMATTER_CHUNK_SIZE * 3)
+    )
+    assert read_frontmatter(skill_md) == "---\nname: test-skill\n---"
 
 
-def test_parse_frontmatter_missing():
-    """Test parsing content without frontmatter."""
-    content = "# No frontmatter here"
+def test_read_frontmatter_without_frontmatter(fs):
+    """Test that a file not starting with --- is only read up to the first chunk."""
+    skill_md = Path("/skills/test-skill/SKILL.md")
+    # Odd-length prefix so the first chunk ends inside a two-byte character
+    fs.create_file(skill_md, contents="# Title!\n" + "é" * (FRONTMATTER_CHUNK_SIZE * 3))
+    content = read_frontmatter(skill_md)
+    assert len(content) <= FRONTMATTER_CHUNK_SIZE
     with pytest.raises(ValueError, match="must start with YAML frontmatter"):
         parse_frontmatter(content)
 
 
-def test_parse_frontmatter_not_closed():
-    """Test parsing frontmatter that isn't closed."""
-    content = """---
-name: test-skill
-"""
-    with pytest.raises(ValueError, match="not properly closed"):
-        parse_frontmatter(content)
+def test_read_frontmatter_fence_across_chunks(fs):
+    """Test finding a closing fence that straddles a chunk boundary."""
+    padding = "x" * (FRONTMATTER_CHUNK_SIZE - len("---\ndescription: ") - 2)
+    content = f"---\ndescription: {padding}\n---\nBody\n"
+    skill_md = Path("/skills/test-skill/SKILL.md")
+    fs.create_file(skill_md, contents=content)
+    assert read_frontmatter(skill_md) == content[: content.index("\n---\n") + 4]
+
+
+@pytest.mark.parametrize(
+    "content,expected,error",
+    [
+        pytest.param(
+            VALID_FM,
+            ({"name": "test-skill", "description": "A test skill"}, "# Body content"),
+            None,
+            id="valid",
+        ),
+        pytest.param(
+            DASHES_IN_VALUE_FM,
+            ({"name": "test-skill", "description": "Before---after"}, "Body"),
+            None,
+            id="dashes-inside-value",
+        ),
+        pytest.param(
+            UNTYPED_SCALARS_FM,
+            ({"name": "2024-01-01", "description": "yes", "1": "z"}, ""),
+            None,
+            id="scalars-stay-strings",
+        ),
+        pytest.param(
+            LIST_NAME_FM,
+            ({"name": ["a", "b"], "description": "Test skill"}, ""),
+            None,
+            id="non-scalar-name",
+        ),
+        pytest.param(
+            DUPLICATE_KEY_FM,
+            None,
+            "(?s)Invalid YAML in frontmatter.*duplicate key",
+            id="duplicate-key",
+        ),
+        pytest.param(
+            TAGGED_VALUE_FM,
+            None,
+            "(?s)Invalid YAML in frontmatter.*explicit tag",
+            id="explicit-tag",
+        ),
+        pytest.param(NO_FM, None, "must start with YAML frontmatter", id="missing"),
+        pytest.param(UNCLOSED_FM, None, "not properly closed", id="not-closed"),
+        pytest.param(INVALID_YAML_FM, None, "Invalid YAML in frontmatter", id="invalid-yaml"),
+    ],
+)
+def test_parse_frontmatter(content, expected, error):
+    """Test parsing frontmatter, including '---' inside a value and malformed input."""
+    if error:
+        with pytest.raises(ValueError, match=error):
+            parse_frontmatter(content)
+    else:
+        assert parse_frontmatter(content) == expected
+
+
+def test_validate_non_string_key(fs):
+    """Test that a numeric frontmatter key is reported as an unexpected field."""
+    fs.create_file(
+        "/skills/test-skill/SKILL.md",
+        contents="---\nname: test-skill\ndescription: Test skill\n1: z\n---\n",
+    )
+    result = validate_skill(Path("/skills/test-skill"))
+    assert "Unexpected fields in frontmatter: 1" in _msgs(result)
+
 
+def test_validate_numeric_compatibility(fs):
+    """Test that a compatibility value YAML would read as a number is accepted."""
+    fs.create_file(
+        "/skills/test-skill/SKILL.md",
+        contents="---\nname: test-skill\ndescription: Test skill\ncompatibility: 3.12\n---\n",
+    )
+    result = validate_skill(Path("/skills/test-skill"))
+    assert result.is_valid, _msgs(result)
+
+
+def test_validate_non_scalar_name(fs):
+    """Test that a list name is reported and not recorded as the skill name."""
+    fs.create_file("/skills/test-skill/SKILL.md", contents=LIST_NAME_FM)
+    result = validate_skill(Path("/skills/test-skill"))
+    assert result.skill_name is None
+    assert "Field 'name' must be a non-empty string" in _msgs(result)
 
-def test_validate_valid_skill(valid_skill_path):
+
+def test_validate_valid_skill(valid_skill_path, validate_cache):
     """Test validating a valid skill."""
-    result = validate_skill(valid_skill_path)
+    result = validate_cache(str(valid_skill_path))
     assert result.is_valid
     assert result.skill_name == "valid-skill"
-    assert len(result.errors or []) == 0
+    assert len(result.errors) == 0
 
 
-def test_validate_invalid_skill(invalid_skill_path):
+def test_validate_invalid_skill(invalid_skill_path, validate_cache):
     """Test validating an invalid skill."""
-    result = validate_skill(invalid_skill_path)
+    result = validate_cache(str(invalid_skill_path))
     assert not result.is_valid
-    assert len(result.errors or []) > 0
+    assert len(result.errors) > 0
 
     # Check for specific errors
-    error_messages = [e.message for e in (result.errors or [])]
-    assert any("must be lowercase" in msg for msg in error_messages)
+    assert "must be lowercase" in _msgs(result)
 
 
-def test_validate_nonexistent_path(tmp_path):
+def test_validate_nonexistent_path():
     """Test validating a path that doesn't exist."""
-    nonexistent = tmp_path / "nonexistent"
+    nonexistent = Path("/__skill_doctor_no_such_path__")
     result = validate_skill(nonexistent)
     assert not result.is_valid
-    assert len(result.errors or []) > 0
-    assert any("does not exist" in e.message for e in (result.errors or []))
+    assert len(result.errors) > 0
+    assert "does not exist" in _msgs(result)
 
 
-def test_validate_not_directory(tmp_path):
+def test_validate_not_directory(fs):
     """Test validating a path that is not a directory."""
-    file_path = tmp_path / "test.txt"
-    file_path.write_text("test")
+    file_path = Path("/skills/test.txt")
+    fs.create_file(file_path, contents="test")
     result = validate_skill(file_path)
     assert not result.is_valid
-    assert any("Not a directory" in e.message for e in (result.errors or []))
+    assert "Not a directory" in _msgs(result)
 
 
-def test_validate_missing_skill_md(tmp_path):
+def test_validate_missing_skill_md(fs):
     """Test validating a directory without SKILL.md."""
-    result = validate_skill(tmp_path)
-    assert not result.is_valid
-    assert any("Missing required file" in e.message for e in (result.errors or []))
-
-
-def test_validate_missing_name(tmp_path):
-    """Test skill missing required 'name' field."""
-    skill_dir = tmp_path / "test-skill"
-    skill_dir.mkdir()
-    (skill_dir / "SKILL.md").write_text("""---
-description: A skill without a name
----
-Body content
-""")
+    skill_dir = Path("/skills/test-skill")
+    fs.create_dir(skill_dir)
     result = validate_skill(skill_dir)
     assert not result.is_valid
-    assert any(
-        "Missing required field" in e.message and "name" in e.message for e in (result.errors or [])
-    )
-
-
-def test_validate_missing_description(tmp_path):
-    """Test skill missing required 'description' field."""
-    skill_dir = tmp_path / "test-skill"
-    skill_dir.mkdir()
-    (skill_dir / "SKILL.md").write_text("""---
-name: test-skill
----
-Body content
-""")
-    result = validate_skill(skill_dir)
-    assert not result.is_valid
-    assert any(
-        "Missing required field" in e.message and "description" in e.message
-        for e in (result.errors or [])
-    )
-
-
-def test_validate_name_too_long(tmp_path):
-    """Test skill name exceeding maximum length."""
-    long_name = "x" * 65
-    skill_dir = tmp_path / long_name
-    skill_dir.mkdir()
-    (skill_dir / "SKILL.md").write_text(f"""---
-name: {long_name}
-description: Test skill
----
-Body content
-""")
-    result = validate_skill(skill_dir)
-    assert not result.is_valid
-    assert any(
-        "exceeds" in e.message and "character limit" in e.message for e in (result.errors or [])
-    )
+    assert "Missing required file" in _msgs(result)
 
 
-def test_validate_name_with_uppercase(tmp_path):
-    """Test skill name with uppercase letters."""
-    skill_dir = tmp_path / "Test-Skill"
-    skill_dir.mkdir()
-    (skill_dir / "SKILL.md").write_text("""---
-name: Test-Skill
-description: Test skill
----
-Body content
-""")
-    result = validate_skill(skill_dir)
-    assert not result.is_valid
-    assert any("must be lowercase" in e.message for e in (result.errors or []))
-
-
-def test_validate_name_with_consecutive_hyphens(tmp_path):
-    """Test skill name with consecutive hyphens."""
-    skill_dir = tmp_path / "test--skill"
-    skill_dir.mkdir()
-    (skill_dir / "SKILL.md").write_text("""---
-name: test--skill
-description: Test skill
----
-Body content
-""")
-    result = validate_skill(skill_dir)
-    assert not result.is_valid
-    assert any("consecutive hyphens" in e.message for e in (result.errors or []))
-
-
-def test_validate_description_too_long(tmp_path):
-    """Test description exceeding maximum length."""
-    skill_dir = tmp_path / "test-skill"
-    skill_dir.mkdir()
-    long_desc = "x" * 1025
-    (skill_dir / "SKILL.md").write_text(f"""---
-name: test-skill
-description: {long_desc}
----
-Body content
-""")
-    result = validate_skill(skill_dir)
-    assert not result.is_valid
-    assert any("Description exceeds" in e.message for e in (result.errors or []))
-
-
-def test_validate_name_directory_mismatch(tmp_path):
-    """Test when directory name doesn't match skill name."""
-    skill_dir = tmp_path / "wrong-name"
-    skill_dir.mkdir()
-    (skill_dir / "SKILL.md").write_text("""---
-name: test-skill
-description: Test skill
----
-Body content
-""")
-    result = validate_skill(skill_dir)
+@pytest.mark.parametrize(
+    "dir_name,template,expected_substr",
+    INVALID_CASES,
+    ids=[template for _, template, _ in INVALID_CASES],
+)
+def test_validate_invalid_skill_md(make_skill_dir, dir_name, template, expected_substr):
+    """Test each SKILL.md rule violation reports its error."""
+    result = validate_skill(make_skill_dir(dir_name, template))
     assert not result.is_valid
-    assert any("must match skill name" in e.message for e in (result.errors or []))
+    assert expected_substr in _msgs(result)
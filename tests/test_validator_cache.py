@@ -0,0 +1,129 @@
+"""Tests for the validator_cache module."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from skill_doctor import __version__
+from skill_doctor.models import ValidationResult
+from skill_doctor.validator import validate_skill
+from skill_doctor.validator_cache import ValidationCache
+
+SKILL_DIR = Path("/skills/test-skill")
+SKILL_MD = SKILL_DIR / "SKILL.md"
+CACHE_FILE = Path("/cache/cache.json")
+
+
+def _write_skill(fs, name):
+    content = f"""---
+name: {name}
+description: Test skill
+---
+Body content
+"""
+    if SKILL_MD.exists():
+        SKILL_MD.write_text(content)
+    else:
+        fs.create_file(SKILL_MD, contents=content)
+
+
+def test_cache_roundtrip(fs):
+    """Test that a saved result is returned for an unchanged SKILL.md."""
+    _write_skill(fs, "Test-Skill")
+
+    cache = ValidationCache(CACHE_FILE)
+    result = validate_skill(SKILL_DIR, cache)
+    cache.save()
+
+    cached = ValidationCache(CACHE_FILE).get(SKILL_MD, ValidationCache.digest(SKILL_MD))
+    assert cached == result
+    assert not cached.is_valid
+
+
+def test_cache_miss_when_file_changes(fs):
+    """Test that a modified SKILL.md is revalidated."""
+    _write_skill(fs, "Test-Skill")
+    cache = ValidationCache(CACHE_FILE)
+    assert not validate_skill(SKILL_DIR, cache).is_valid
+
+    _write_skill(fs, "test-skill")
+
+    assert cache.get(SKILL_MD, ValidationCache.digest(SKILL_MD)) is None
+    assert validate_skill(SKILL_DIR, cache).is_valid
+
+
+def test_cache_hit_after_fresh_checkout(fs):
+    """Test that rewriting identical contents with a new mtime still hits."""
+    _write_skill(fs, "Test-Skill")
+    cache = ValidationCache(CACHE_FILE)
+    result = validate_skill(SKILL_DIR, cache)
+    cache.save()
+
+    _write_skill(fs, "Test-Skill")
+    stat = SKILL_MD.stat()
+    os.utime(SKILL_MD, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert ValidationCache(CACHE_FILE).get(SKILL_MD, ValidationCache.digest(SKILL_MD)) == result
+
+
+def test_cache_ignores_other_versions(fs):
+    """Test that entries written by another version are discarded."""
+    _write_skill(fs, "test-skill")
+
+    cache = ValidationCache(CACHE_FILE)
+    validate_skill(SKILL_DIR, cache)
+    cache.save()
+
+    data = json.loads(CACHE_FILE.read_text())
+    data["version"] = "0.0.0"
+    CACHE_FILE.write_text(json.dumps(data))
+
+    assert ValidationCache(CACHE_FILE).get(SKILL_MD, ValidationCache.digest(SKILL_MD)) is None
+
+
+def test_cache_unreadable_file(fs):
+    """Test that a corrupt cache file starts an empty cache."""
+    fs.create_file(CACHE_FILE, contents="not json")
+    _write_skill(fs, "test-skill")
+
+    assert ValidationCache(CACHE_FILE).get(SKILL_MD, ValidationCache.digest(SKILL_MD)) is None
+
+
+def test_cache_save_unserializable_leaves_no_file(fs):
+    """Test that a result JSON can't encode fails before anything is written."""
+    _write_skill(fs, "test-skill")
+
+    cache = ValidationCache(CACHE_FILE)
+    result = ValidationResult(skill_path=str(SKILL_DIR), skill_name=object())
+    cache.put(SKILL_MD, ValidationCache.digest(SKILL_MD), result)
+
+    with pytest.raises(TypeError):
+        cache.save()
+    assert not CACHE_FILE.parent.exists()
+
+
+def _write_cache(fs, entries):
+    fs.create_file(CACHE_FILE, contents=json.dumps({"version": __version__, "entries": entries}))
+
+
+def test_cache_entries_not_a_mapping(fs):
+    """Test that a current-version cache whose entries aren't a mapping starts empty."""
+    _write_skill(fs, "test-skill")
+    _write_cache(fs, [])
+
+    cache = ValidationCache(CACHE_FILE)
+    assert cache.get(SKILL_MD, ValidationCache.digest(SKILL_MD)) is None
+    assert validate_skill(SKILL_DIR, cache).is_valid
+
+
+def test_cache_entry_missing_fields(fs):
+    """Test that an entry whose result can't be rebuilt is a miss."""
+    _write_skill(fs, "test-skill")
+    digest = ValidationCache.digest(SKILL_MD)
+    _write_cache(fs, {str(SKILL_MD): {"sha256": digest, "result": {"skill_path": str(SKILL_DIR)}}})
+
+    cache = ValidationCache(CACHE_FILE)
+    assert cache.get(SKILL_MD, digest) is None
+    assert validate_skill(SKILL_DIR, cache).is_valid